@@ -19,6 +19,10 @@ random-access to the command line parameters via :class:`UnparsedArguments`, or
 can apply a particular coercion to a string value via
 :func:`value_from_string`.
 
+When encoding or decoding whole populations of jobs that share a
+typemap, a :class:`JobCodec` amortizes the typemap setup across all of
+them.
+
 To turn a job into a shell command, use :func:`shell_command_from_job`.
 This uses the :func:`shell_word_from_string` function for escaping.
 
@@ -62,9 +66,15 @@ Example: Decoding arguments inside a script::
 
 """
 
+import functools
 import re
+import sys
+import types
+import weakref
+
+_MISSING = object()
 
-import multijob.job
+_BOOL_VALUES = {'True': True, 'False': False}
 
 def _parse_bool(value):
     """Parse a boolean string "True" or "False".
@@ -80,43 +90,61 @@ def _parse_bool(value):
         ValueError: Expected 'True' or 'False' but got 'glorp'
     """
 
-    if value == 'True':
-        return True
-    if value == 'False':
-        return False
-    raise ValueError("Expected 'True' or 'False' but got {!r}".format(value))
+    result = _BOOL_VALUES.get(value, _MISSING)
+    if result is _MISSING:
+        raise ValueError(
+            f"Expected 'True' or 'False' but got {value!r}")
+    return result
 
-def _update_ex_message(ex, new_message, *args, **kwargs):
-    """Given an exception, prepend something to its message.
+def _perform_coercion(name, value, coercion):
+    try:
+        return coercion(value)
+    except ValueError as ex:
+        raise ValueError(
+            f"Could not coerce {name!r}={value!r}:\n{ex.args[0]}") from ex
 
-    Example::
+# interned copies of the coercion names, so that the usual case –
+# a short literal like 'int', which CPython interns automatically –
+# resolves with four identity checks instead of a dict lookup
+_STR_NAME = sys.intern('str')
+_INT_NAME = sys.intern('int')
+_FLOAT_NAME = sys.intern('float')
+_BOOL_NAME = sys.intern('bool')
 
-        >>> ex = TypeError("bad type")
-        >>> _update_ex_message(ex, "caught with x={}:", 42)
-        >>> raise ex
-        Traceback (most recent call last):
-        TypeError: caught with x=42:
-        bad type
+@functools.lru_cache(maxsize=None)
+def _resolve_named_coercion(name):
+    """Resolve a named coercion to its callable, memoized.
 
-    """
+    Only the fixed set of named coercions passes through here,
+    so an unbounded cache is safe.
 
-    new_message = new_message.format(*args, **kwargs)
-    new_args = []
-    new_args.append(new_message + "\n" + ex.args[0])
-    new_args.extend(ex.args[1:])
-    ex.args = new_args
+    Example::
 
-def _perform_coercion(name, value, coercion):
-    try:
-        return coercion(value)
-    except ValueError as ex:
-        _update_ex_message(ex, "Could not coerce {!r}={!r}:", name, value)
-        raise
+        >>> _resolve_named_coercion('int')
+        <class 'int'>
+        >>> _resolve_named_coercion('int') is _resolve_named_coercion('int')
+        True
+    """
+    return Coercion.NAMED_COERCIONS[name]
 
 def _check_coercion(name, coercion, *, named_coercions):
     if named_coercions is not None:
         if isinstance(coercion, str):
-            coercion = named_coercions[coercion]
+            if named_coercions is Coercion.NAMED_COERCIONS:
+                # only valid for the default set –
+                # a custom dict may remap these names
+                if coercion is _INT_NAME:
+                    coercion = int
+                elif coercion is _FLOAT_NAME:
+                    coercion = float
+                elif coercion is _STR_NAME:
+                    coercion = str
+                elif coercion is _BOOL_NAME:
+                    coercion = _parse_bool
+                else:
+                    coercion = _resolve_named_coercion(coercion)
+            else:
+                coercion = named_coercions[coercion]
 
     if coercion is None:
         return None
@@ -125,7 +153,7 @@ def _check_coercion(name, coercion, *, named_coercions):
         return coercion
 
     raise TypeError(
-        '{!r} coercion must be callable: {!r}'.format(name, coercion))
+        f'{name!r} coercion must be callable: {coercion!r}')
 
 class _Default(object):
     # pylint: disable=too-few-public-methods
@@ -134,6 +162,14 @@ class _Default(object):
 
 _Default = _Default()  # pylint: disable=invalid-name
 
+# Coercion wrappers, cached per callable so that repeated typemap
+# compiles reuse the already-validated wrapper. Callables that don't
+# support weak references (e.g. method descriptors like str.upper or
+# operator.itemgetter instances – built-in types and plain functions
+# are fine) go into a small permanent cache instead.
+_WEAK_COERCIONS = weakref.WeakKeyDictionary()
+_STRONG_COERCIONS = {}
+
 class Coercion(object):  # pylint: disable=too-few-public-methods
     """
     Coercion from command line args to Python objects.
@@ -150,6 +186,11 @@ class Coercion(object):  # pylint: disable=too-few-public-methods
     -   ``'float'``
     -   ``'bool'``
 
+    This set is fixed: ``NAMED_COERCIONS`` is a read-only mapping and
+    its entries are resolved ahead of time, so they cannot be replaced
+    by mutation. To use different names, pass a custom
+    *named_coercions* dict to :meth:`Coercion.of`.
+
     Example: coercion function::
 
         >>> Coercion.of(int, paramname='x')('x', '42')
@@ -194,12 +235,12 @@ class Coercion(object):  # pylint: disable=too-few-public-methods
 
     """
 
-    NAMED_COERCIONS = dict(
+    NAMED_COERCIONS = types.MappingProxyType(dict(
         str=str,
         int=int,
         float=float,
         bool=_parse_bool,
-    )
+    ))
 
     __private = []
 
@@ -243,11 +284,171 @@ class Coercion(object):  # pylint: disable=too-few-public-methods
         if isinstance(coercion, Coercion):
             return coercion
 
-        return Coercion(Coercion.__private, coercion)
+        cache = None
+        try:
+            return _WEAK_COERCIONS[coercion]
+        except KeyError:
+            cache = _WEAK_COERCIONS
+        except TypeError:
+            try:
+                return _STRONG_COERCIONS[coercion]
+            except KeyError:
+                cache = _STRONG_COERCIONS
+            except TypeError:
+                pass  # unhashable callable, don't cache
+
+        wrapper = Coercion(Coercion.__private, coercion)
+        if cache is not None:
+            cache[coercion] = wrapper
+        return wrapper
 
     def __call__(self, name, value):
         return _perform_coercion(name, value, self._parser)
 
+_STR_COERCION = Coercion.of(str, paramname='<default>')
+
+# str() results for simple immutable values, shared across jobs that
+# repeat the same params (e.g. over repetitions). typed=True keeps
+# True/1 and 1/1.0 apart despite comparing equal, but cannot separate
+# -0.0 from 0.0 (same type, equal) – callers must skip float zeros.
+_cached_str = functools.lru_cache(maxsize=1024, typed=True)(str)
+
+class CompiledTypemap(object):
+    """A typemap whose coercions were resolved ahead of time.
+
+    Do not create directly – use :func:`compile_typemap` instead!
+
+    Args:
+        coercions (dict): maps param names to :class:`Coercion` objects.
+        default (Coercion): fallback coercion for unlisted params, may be None.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, coercions, default):
+        self._coercions = coercions
+        self._default = default
+
+    def get(self, name):
+        """Look up the coercion for ``name``, falling back to the default."""
+        return self._coercions.get(name, self._default)
+
+def compile_typemap(typemap, default_coercion=None, *, named_coercions=_Default):
+    """Resolve all coercions of a typemap once, ahead of use.
+
+    Named coercions are looked up and callables validated a single time,
+    so reusing the compiled typemap over many jobs avoids per-value
+    resolution overhead. All functions taking a *typemap* argument also
+    accept an already compiled typemap.
+
+    Args:
+        typemap (Typemap):
+            The typemap to compile, may be *None* for an empty one.
+            A :class:`CompiledTypemap` is returned unchanged.
+        default_coercion (Coercion):
+            Optional. Coercion for params without a typemap entry.
+        named_coercions (dict):
+            Optional. Available named coercions.
+            Defaults to ``Coercion.NAMED_COERCIONS``.
+
+    Returns:
+        CompiledTypemap: the compiled typemap.
+
+    Example::
+
+        >>> compiled = compile_typemap(dict(a='int'), default_coercion=str)
+        >>> compiled.get('a')('a', '42')
+        42
+        >>> compiled.get('b')('b', '42')
+        '42'
+
+    Example: compiling is idempotent::
+
+        >>> compile_typemap(compiled) is compiled
+        True
+
+    Example: a compiled typemap keeps its default coercion::
+
+        >>> compile_typemap(compiled, default_coercion='int')
+        Traceback (most recent call last):
+        TypeError: cannot override the default coercion of a compiled typemap
+    """
+
+    if isinstance(typemap, CompiledTypemap):
+        if default_coercion is not None:
+            raise TypeError(
+                "cannot override the default coercion "
+                "of a compiled typemap")
+        return typemap
+
+    if typemap is None:
+        typemap = {}
+
+    coercions = {
+        name: Coercion.of(
+            coercion, paramname=name, named_coercions=named_coercions)
+        for name, coercion in typemap.items()
+    }
+
+    default = Coercion.of(
+        default_coercion, paramname='<default>',
+        named_coercions=named_coercions)
+
+    return CompiledTypemap(coercions, default)
+
+_EMPTY_TYPEMAP = CompiledTypemap({}, None)
+
+_ARGV_PARSER_CACHE = {}
+
+def build_argv_parser(typemap, default_coercion=None):
+    """Build a reusable argv parser specialized for one typemap.
+
+    The typemap is compiled exactly once and the returned function only
+    performs the per-argument work, so workers that parse many argvs
+    with the same typemap skip all coercion resolution in the steady
+    state. Parsers are cached by typemap contents where possible, so
+    repeated calls with equal typemaps return the same parser.
+
+    Args:
+        typemap (Typemap):
+            Controls how individual params are parsed.
+        default_coercion (Coercion):
+            Optional. Controls how params without a typemap entry are
+            parsed.
+
+    Returns:
+        Callable[[list], dict]: parses an argv of ``name=value`` words
+        into a params dict.
+
+    Example::
+
+        >>> parse = build_argv_parser(dict(a='int', b='bool'))
+        >>> parse(['a=42', 'b=True']) == dict(a=42, b=True)
+        True
+        >>> parse is build_argv_parser(dict(a='int', b='bool'))
+        True
+    """
+
+    try:
+        key = (frozenset(typemap.items()), default_coercion)
+        parser = _ARGV_PARSER_CACHE.get(key)
+    except (AttributeError, TypeError):
+        key = None  # compiled or unhashable typemap, don't cache
+        parser = None
+
+    if parser is not None:
+        return parser
+
+    compiled = compile_typemap(typemap, default_coercion)
+
+    def parse(argv):
+        return _dict_from_argv(argv, typemap=compiled)
+
+    if key is not None:
+        _ARGV_PARSER_CACHE[key] = parse
+
+    return parse
+
 def value_from_string(name, value, coercion):
     """Parse a value from a string with a given coercion.
 
@@ -277,7 +478,7 @@ def value_from_string(name, value, coercion):
     coercion = Coercion.of(coercion, paramname=name)
 
     if coercion is None:
-        raise TypeError("no coercion found for {!r}={!r}".format(name, value))
+        raise TypeError(f"no coercion found for {name!r}={value!r}")
 
     return coercion(name, value)
 
@@ -320,13 +521,48 @@ def _string_from_value(name, value, coercion):
 
     return coercion(name, value)
 
+# anchored to whole lines so that a token like '=a=b' splits at its
+# first '=' (empty name) exactly like str.partition, instead of the
+# regex matching mid-line
+_ARG_RE = re.compile(r'^([^=\n]*)=([^\n]*)$', re.MULTILINE)
+
+_BATCH_PARSE_MIN = 16
+
+def _split_args(argv):
+    """Split ``name=value`` words into pairs, one at a time."""
+    for arg in argv:
+        name, sep, value = arg.partition('=')
+        if not sep:
+            raise ValueError(f"missing '=' in argument {arg!r}")
+        yield name, value
+
+def _argv_pairs(argv):
+    """Split ``name=value`` words into pairs.
+
+    Long argv lists are scanned in one go by a compiled regex instead
+    of a Python-level loop. Inputs the regex cannot represent exactly
+    (embedded newlines, missing ``=``) fall back to the per-word path,
+    keeping the results and error reporting unchanged.
+    """
+
+    if isinstance(argv, list) and len(argv) >= _BATCH_PARSE_MIN:
+        joined = '\n'.join(argv)
+        if joined.count('\n') == len(argv) - 1:
+            pairs = _ARG_RE.findall(joined)
+            if len(pairs) == len(argv):
+                return pairs
+
+    return _split_args(argv)
+
 def _unparsed_dict_from_argv(argv):
     """Split command line arguments into a dict, without applying coercions.
     """
     arg_dict = dict()
 
     for arg in argv:
-        name, value = arg.split('=', 1)
+        name, sep, value = arg.partition('=')
+        if not sep:
+            raise ValueError(f"missing '=' in argument {arg!r}")
         arg_dict[name] = value
 
     return arg_dict
@@ -342,15 +578,24 @@ class UnparsedArguments(object):
         args (dict): the name-value command line parameters.
     """
 
+    __slots__ = ('_args',)
+
     def __init__(self, args):
         self._args = dict(args)
 
+    @classmethod
+    def _from_owned(cls, args):
+        """Take ownership of a freshly built dict, skipping the copy."""
+        obj = cls.__new__(cls)
+        obj._args = args
+        return obj
+
     @staticmethod
     def from_argv(argv):
         """Create UnparsedArguments from an argv array.
         """
 
-        return UnparsedArguments(_unparsed_dict_from_argv(argv))
+        return UnparsedArguments._from_owned(_unparsed_dict_from_argv(argv))
 
     def read(self, name, coercion):
         """Consume and coerce a named argument.
@@ -369,10 +614,9 @@ class UnparsedArguments(object):
             ValueError: when the value can't be coerced.
         """
 
-        try:
-            value = self._args.pop(name)
-        except KeyError:
-            raise KeyError("expected {!r} in argv".format(name))
+        value = self._args.pop(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"expected {name!r} in argv")
 
         return value_from_string(name, value, coercion)
 
@@ -401,17 +645,45 @@ def _dict_from_argv(argv, *, typemap, default_coercion=None):
         d: str = '42'
     """
 
+    typemap = compile_typemap(typemap, default_coercion)
+
     arg_dict = dict()
 
-    unparsed = UnparsedArguments.from_argv(argv)
-    for name in list(unparsed):
-        coercion = typemap.get(name, default_coercion)
-        value = unparsed.read(name, coercion)
-        arg_dict[name] = value
+    for name, value in _argv_pairs(argv):
+        coercion = typemap.get(name)
+        if coercion is None:
+            raise TypeError(
+                f"no coercion found for {name!r}={value!r}")
+        # call the parser directly instead of going through
+        # Coercion.__call__ and _perform_coercion – that saves two
+        # call frames per arg; the error handling is replicated here.
+        # pylint: disable=protected-access
+        try:
+            arg_dict[name] = coercion._parser(value)
+        except ValueError as ex:
+            raise ValueError(
+                f"Could not coerce {name!r}={value!r}:\n{ex.args[0]}") from ex
 
     return arg_dict
 
-def _argv_from_dict(arg_dict, *, typemap=None, default_coercion=None):
+@functools.lru_cache(maxsize=128)
+def _sorted_keys(keys):
+    """Sort a frozenset of param names, memoized.
+
+    Jobs in a sweep share one key set, so the sort runs once per
+    distinct set instead of once per encoded job.
+
+    Example::
+
+        >>> _sorted_keys(frozenset(['b', 'a']))
+        ['a', 'b']
+    """
+    return sorted(keys)
+
+def _argv_from_dict(arg_dict, *,
+                    typemap=None,
+                    default_coercion=None,
+                    sort_keys=True):
     """Format a dict as command line args.
 
     Example::
@@ -419,18 +691,48 @@ def _argv_from_dict(arg_dict, *, typemap=None, default_coercion=None):
         >>> argd = dict(a=42, b=True, c='foo=bar', d='42')
         >>> _argv_from_dict(argd)
         ['a=42', 'b=True', 'c=foo=bar', 'd=42']
-    """
 
-    if typemap is None:
-        typemap = {}
+    Example: insertion order is kept when sorting is disabled::
 
-    argv = []
+        >>> _argv_from_dict(dict(b=1, a=2), sort_keys=False)
+        ['b=1', 'a=2']
+    """
 
-    for name in sorted(arg_dict):
-        value = arg_dict[name]
-        coercion = typemap.get(name, default_coercion)
-        coerced_value = _string_from_value(name, value, coercion)
-        argv.append("{}={}".format(name, coerced_value))
+    if typemap is None and default_coercion is None:
+        # common case, e.g. encoding without any typemap:
+        # nothing to compile, every value takes the default-str path
+        typemap = _EMPTY_TYPEMAP
+    else:
+        typemap = compile_typemap(typemap, default_coercion,
+                                  named_coercions=None)
+
+    if sort_keys:
+        items = [(name, arg_dict[name])
+                 for name in _sorted_keys(frozenset(arg_dict))]
+    else:
+        items = arg_dict.items()
+    argv = [None] * len(items)
+
+    for i, (name, value) in enumerate(items):
+        coercion = typemap.get(name)
+        if coercion is None:
+            # default str coercion – fast paths for the common value
+            # types, which stringify deterministically and safely
+            vtype = type(value)
+            if vtype is str:
+                argv[i] = name + '=' + value
+                continue
+            if vtype is int or vtype is float or vtype is bool:
+                if vtype is float and value == 0.0:
+                    # -0.0 == 0.0, so the equality-keyed cache would
+                    # conflate the two and corrupt the sign
+                    argv[i] = name + '=' + str(value)
+                else:
+                    argv[i] = name + '=' + _cached_str(value)
+                continue
+            coercion = _STR_COERCION
+        # the f-string stringifies coercions that return non-str values
+        argv[i] = f'{name}={coercion(name, value)}'
 
     return argv
 
@@ -445,18 +747,182 @@ class JobArgvConfig(object):
     # pylint: disable=too-few-public-methods
 
     def __init__(self, *, job_id_key, repetition_id_key):
-        self.job_id_key = job_id_key
-        self.repetition_id_key = repetition_id_key
+        self.job_id_key = sys.intern(job_id_key)
+        self.repetition_id_key = sys.intern(repetition_id_key)
 
 DEFAULT_JOB_ARGV_CONFIG = JobArgvConfig(
     job_id_key='--id',
     repetition_id_key='--rep')
 
+class JobCodec(object):
+    """Encode and decode whole populations of jobs with one typemap.
+
+    The typemap is compiled once at construction, so encoding or
+    decoding each additional job only pays the per-param work.
+    :func:`job_from_argv` and :func:`argv_from_job` are one-shot
+    wrappers around this class.
+
+    Args:
+        typemap (Typemap):
+            Optional. Controls how individual params are encoded and
+            decoded.
+        default_coercion (Coercion):
+            Optional. Controls params without a typemap entry.
+        job_argv_config (JobArgvConfig):
+            Optional. Controls names of job attributes.
+        sort_keys (bool):
+            Optional. Sort params by name when encoding (the default).
+            Disable to keep the insertion order of the params dict,
+            skipping the per-job sort.
+
+    Example: decoding a population::
+
+        >>> def target(a):
+        ...     return a + 1
+        >>> codec = JobCodec(typemap=dict(a='int'))
+        >>> jobs = codec.decode_many(
+        ...     [['--id=0', '--rep=0', '--', 'a=1'],
+        ...      ['--id=1', '--rep=0', '--', 'a=2']],
+        ...     target)
+        >>> [job.params['a'] for job in jobs]
+        [1, 2]
+
+    Example: encoding a population::
+
+        >>> from multijob.job import Job
+        >>> def target(): pass
+        >>> codec = JobCodec()
+        >>> jobs = [Job(i, 0, target, dict(x=i)) for i in range(2)]
+        >>> codec.encode_many(jobs)
+        [['--id=0', '--rep=0', '--', 'x=0'], ['--id=1', '--rep=0', '--', 'x=1']]
+    """
+
+    def __init__(self, *,
+                 typemap=None,
+                 default_coercion=None,
+                 job_argv_config=DEFAULT_JOB_ARGV_CONFIG,
+                 sort_keys=True):
+        if job_argv_config is None:
+            # None was the documented default before the shared
+            # DEFAULT_JOB_ARGV_CONFIG existed; keep accepting it
+            job_argv_config = DEFAULT_JOB_ARGV_CONFIG
+        self._job_argv_config = job_argv_config
+        self._sort_keys = sort_keys
+        self._typemap = typemap
+        self._default_coercion = default_coercion
+        self._decode_typemap = compile_typemap(typemap, default_coercion)
+        # the encode side rejects named coercions,
+        # so it is only compiled when actually encoding
+        self._encode_typemap = None
+        # precomputed for the positional fast path in decode()
+        self._job_id_prefix = job_argv_config.job_id_key + '='
+        self._repetition_id_prefix = job_argv_config.repetition_id_key + '='
+
+    def decode(self, argv, callback):
+        """Parse command line arguments into a job object.
+
+        See :func:`job_from_argv` for details and examples.
+        """
+
+        config = self._job_argv_config
+
+        # fast path: a header produced by encode() is positional –
+        # ['--id=N', '--rep=M', '--', ...]. Anything that deviates
+        # falls through to the generic scan, which owns the error
+        # messages for malformed input.
+        job_id = None
+        if (len(argv) >= 3 and argv[2] == '--'
+                and argv[0].startswith(self._job_id_prefix)
+                and argv[1].startswith(self._repetition_id_prefix)):
+            try:
+                job_id = int(argv[0][len(self._job_id_prefix):])
+                repetition_id = int(
+                    argv[1][len(self._repetition_id_prefix):])
+            except ValueError:
+                job_id = None
+
+        if job_id is not None:
+            param_args = argv[3:]
+        else:
+            meta_args = []
+            arg_iter = iter(argv)
+            for arg in arg_iter:
+                if arg == '--':
+                    break
+                meta_args.append(arg)
+            else:
+                raise ValueError("no argument separator '--' found")
+
+            param_args = list(arg_iter)
+
+            raw_meta = UnparsedArguments.from_argv(meta_args)
+
+            job_id = raw_meta.read(config.job_id_key, int)
+            repetition_id = raw_meta.read(config.repetition_id_key, int)
+
+            if raw_meta:
+                keys = sorted(raw_meta)
+                raise TypeError(f"unexpected meta args: {', '.join(keys)}")
+
+        params = _dict_from_argv(param_args, typemap=self._decode_typemap)
+
+        # imported lazily so that dispatcher scripts which only encode
+        # commands never load the job module at all
+        from multijob.job import Job
+
+        return Job(job_id, repetition_id, callback, params)
+
+    def _encode_parts(self, job):
+        """The meta and params halves of :meth:`encode`, as two lists."""
+
+        if self._encode_typemap is None:
+            self._encode_typemap = compile_typemap(
+                self._typemap, self._default_coercion, named_coercions=None)
+
+        config = self._job_argv_config
+
+        meta = [
+            f'{config.job_id_key}={job.job_id}',
+            f'{config.repetition_id_key}={job.repetition_id}',
+        ]
+
+        params = _argv_from_dict(job.params,
+                                 typemap=self._encode_typemap,
+                                 sort_keys=self._sort_keys)
+
+        return meta, params
+
+    def encode(self, job):
+        """Format a job as command line arguments.
+
+        See :func:`argv_from_job` for details and examples.
+        """
+
+        meta, params = self._encode_parts(job)
+        return meta + ['--'] + params
+
+    def decode_many(self, argvs, callback):
+        """Decode several argvs into jobs, amortizing the setup cost.
+
+        Returns:
+            List[multijob.job.Job]: one job per argv.
+        """
+        return [self.decode(argv, callback) for argv in argvs]
+
+    def encode_many(self, jobs):
+        """Encode several jobs, amortizing the setup cost.
+
+        Returns:
+            List[list]: one argv per job.
+        """
+        return [self.encode(job) for job in jobs]
+
 def argv_from_job(job,
                   *,
                   typemap=None,
                   default_coercion=None,
-                  job_argv_config=None):
+                  job_argv_config=DEFAULT_JOB_ARGV_CONFIG,
+                  sort_keys=True):
     r"""Format a job as command line arguments.
 
     To get a job object back from these arguments,
@@ -465,6 +931,9 @@ def argv_from_job(job,
     The ``job.callback`` will not be stored
     and will have to be provided explicitly when parsing the arguments.
 
+    The meta arguments (``--id`` and ``--rep`` by default) are reserved:
+    they are always plain integers and never consult the *typemap*.
+
     Args:
         job (multijob.job):
             The job to format.
@@ -474,6 +943,10 @@ def argv_from_job(job,
             Optional. Controls how params without a typemap entry are formatted.
         job_argv_config (JobArgvConfig):
             Optional. Controls names of job attributes.
+        sort_keys (bool):
+            Optional. Sort params by name (the default). Disable to
+            keep the insertion order of the params dict and skip the
+            per-job sort.
 
     Returns:
         list: The encoded params.
@@ -513,31 +986,57 @@ def argv_from_job(job,
 
     """
 
-    if job_argv_config is None:
-        job_argv_config = DEFAULT_JOB_ARGV_CONFIG
+    codec = JobCodec(typemap=typemap,
+                     default_coercion=default_coercion,
+                     job_argv_config=job_argv_config,
+                     sort_keys=sort_keys)
 
-    meta = _argv_from_dict({
-        job_argv_config.job_id_key: job.job_id,
-        job_argv_config.repetition_id_key: job.repetition_id,
-    })
+    return codec.encode(job)
 
-    params = _argv_from_dict(job.params,
-                             typemap=typemap,
-                             default_coercion=default_coercion)
+def argv_from_job_iter(job,
+                       *,
+                       typemap=None,
+                       default_coercion=None,
+                       job_argv_config=DEFAULT_JOB_ARGV_CONFIG,
+                       sort_keys=True):
+    """Format a job as command line arguments, yielded lazily.
 
-    argv = []
-    argv.extend(meta)
-    argv.append('--')
-    argv.extend(params)
+    A generator variant of :func:`argv_from_job` for callers that
+    stream the arguments – e.g. joining them into a command line or
+    writing them to a file – and have no use for the intermediate list.
 
-    return argv
+    Args:
+        see :func:`argv_from_job`.
+
+    Yields:
+        str: The encoded arguments, one at a time.
+
+    Example::
+
+        >>> from multijob.job import Job
+        >>> def target(): pass
+        >>> job = Job(42, 3, target, dict(a=42))
+        >>> ' '.join(argv_from_job_iter(job))
+        '--id=42 --rep=3 -- a=42'
+    """
+
+    codec = JobCodec(typemap=typemap,
+                     default_coercion=default_coercion,
+                     job_argv_config=job_argv_config,
+                     sort_keys=sort_keys)
+
+    # pylint: disable=protected-access
+    meta, params = codec._encode_parts(job)
+    yield from meta
+    yield '--'
+    yield from params
 
 def job_from_argv(argv,
                   callback,
                   *,
                   typemap,
                   default_coercion=None,
-                  job_argv_config=None):
+                  job_argv_config=DEFAULT_JOB_ARGV_CONFIG):
     """Parse command line arguments into a job object.
 
     Args:
@@ -599,36 +1098,16 @@ def job_from_argv(argv,
         (15, 2, {'a': 'foo'})
     """
 
-    if job_argv_config is None:
-        job_argv_config = DEFAULT_JOB_ARGV_CONFIG
-
-    try:
-        separator_ix = argv.index('--')
-    except ValueError:
-        raise ValueError("no argument separator '--' found")
-
-    meta_args = argv[:separator_ix]
-    param_args = argv[separator_ix + 1:]
-
-    raw_meta = UnparsedArguments.from_argv(meta_args)
-
-    job_id = raw_meta.read(job_argv_config.job_id_key, int)
-    repetition_id = raw_meta.read(job_argv_config.repetition_id_key, int)
+    codec = JobCodec(typemap=typemap,
+                     default_coercion=default_coercion,
+                     job_argv_config=job_argv_config)
 
-    if raw_meta:
-        keys = sorted(raw_meta)
-        raise TypeError("unexpected meta args: {}".format(', '.join(keys)))
-
-    params = _dict_from_argv(param_args,
-                             typemap=typemap,
-                             default_coercion=default_coercion)
-
-    return multijob.job.Job(job_id, repetition_id, callback, params)
+    return codec.decode(argv, callback)
 
 def shell_command_from_job(prefix, job, *,
                            typemap=None,
                            default_coercion=None,
-                           job_argv_config=None):
+                           job_argv_config=DEFAULT_JOB_ARGV_CONFIG):
     """Turn a job into a shell command.
 
     Args:
@@ -650,21 +1129,47 @@ def shell_command_from_job(prefix, job, *,
 
     Example::
 
-        >>> job = multijob.job.Job(40, 2, lambda x: x, dict(y='foo bar'))
+        >>> from multijob.job import Job
+        >>> job = Job(40, 2, lambda x: x, dict(y='foo bar'))
         >>> print(shell_command_from_job('$RUN_GA', job))
         $RUN_GA --id=40 --rep=2 -- 'y=foo bar'
 
     """
 
-    job_argv = argv_from_job(
-        job,
-        typemap=typemap,
-        default_coercion=default_coercion,
-        job_argv_config=job_argv_config)
+    codec = JobCodec(typemap=typemap,
+                     default_coercion=default_coercion,
+                     job_argv_config=job_argv_config)
+
+    # pylint: disable=protected-access
+    meta, params = codec._encode_parts(job)
+
+    # meta tokens are emitted verbatim only when provably safe:
+    # integer ids formatted onto flag names made of safe words.
+    # Anything else – a custom config with odd keys, a job with a
+    # non-int id – is escaped like every other word.
+    config = codec._job_argv_config
+    if (isinstance(job.job_id, int)
+            and isinstance(job.repetition_id, int)
+            and SAFE_SHELL_WORDS_RE.match(config.job_id_key)
+            and SAFE_SHELL_WORDS_RE.match(config.repetition_id_key)):
+        parts = meta
+    else:
+        parts = [shell_word_from_string(s) for s in meta]
+
+    parts = parts + ['--'] + [shell_word_from_string(s) for s in params]
+
+    return prefix + ' ' + ' '.join(parts)
+
+_SAFE_SHELL_CHARS = \
+    '-+abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_=!./'
 
-    return prefix + ' ' + ' '.join(shell_word_from_string(s) for s in job_argv)
+SAFE_SHELL_WORDS_RE = re.compile(
+    r'\A[' + re.escape(_SAFE_SHELL_CHARS) + r']+\Z')
 
-SAFE_SHELL_WORDS_RE = re.compile(r'\A[-+a-zA-Z0-9_=!./]+\Z')
+# Deleting every safe character from a word leaves an empty string
+# exactly when the whole word is safe. A single str.translate pass is
+# cheaper than entering the regex engine per word.
+_UNSAFE_SHELL_CHARS_TABLE = str.maketrans('', '', _SAFE_SHELL_CHARS)
 
 def shell_word_from_string(word):
     r"""Escape arguments for POSIX shells.
@@ -704,7 +1209,7 @@ def shell_word_from_string(word):
     #
     # For command arguments the "=" does not need to be quoted.
     # That leaves us with a couple of safe characters,
-    # see SAFE_SHELL_WORDS_RE
+    # see _SAFE_SHELL_CHARS and SAFE_SHELL_WORDS_RE
     #
     # All other words will be quoted.
     #
@@ -712,6 +1217,6 @@ def shell_word_from_string(word):
 
     if word == '':
         return "''"
-    if SAFE_SHELL_WORDS_RE.match(word):
+    if not word.translate(_UNSAFE_SHELL_CHARS_TABLE):
         return word
     return "'" + word.replace("'", r"'\''") + "'"
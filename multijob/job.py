@@ -8,6 +8,16 @@ When running a job, you get a :class:`JobResult`.
 """
 
 import itertools
+import sys
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+# below this many values, the pure-Python range builders win
+# over the NumPy round-trip
+_NUMPY_MIN_SIZE = 64
 
 class Job(object):
     """A concrete, runnable set of configuration parameters.
@@ -21,11 +31,15 @@ class Job(object):
         params (dict): the parameters
     """
 
+    __slots__ = ('_job_id', '_repetition_id', '_callback', '_params',
+                 '_str_cache')
+
     def __init__(self, job_id, repetition_id, callback, params):
         self._job_id = job_id
         self._repetition_id = repetition_id
         self._callback = callback
         self._params = params
+        self._str_cache = None
 
     @property
     def job_id(self):
@@ -62,20 +76,26 @@ class Job(object):
         return self._params
 
     def __str__(self):
-        job_id = self.job_id
-        repetition_id = self.repetition_id
-        params = self.params
+        # jobs are immutable after construction,
+        # so the formatted string can be computed once
+        if self._str_cache is None:
+            params = self.params
 
-        formatted_params = ' '.join(
-            '{}={!r}'.format(key, params[key])
-            for key in sorted(params.keys())
-        )
+            formatted_params = ' '.join(
+                f'{key}={params[key]!r}'
+                for key in sorted(params.keys())
+            )
 
-        return '{}:{}: {}'.format(job_id, repetition_id, formatted_params)
+            self._str_cache = \
+                f'{self.job_id}:{self.repetition_id}: {formatted_params}'
+
+        return self._str_cache
 
 class JobResult(object):
     """The result of a job execution."""
 
+    __slots__ = ('_job', '_result')
+
     def __init__(self, job, result):
         self._job = job
         self._result = result
@@ -91,12 +111,14 @@ class JobResult(object):
         return self._result
 
 def _dict_list_product(dict_of_lists):
-    lists_of_kv_pairs = [
-        [(key, value) for value in dict_of_lists[key]]
-        for key in sorted(dict_of_lists.keys())]
+    keys = sorted(dict_of_lists.keys())
+    value_lists = [dict_of_lists[key] for key in keys]
 
-    for kv_pairs in itertools.product(*lists_of_kv_pairs):
-        yield dict(kv_pairs)
+    # product() over the raw value lists keeps the combination walk in C;
+    # the keys are paired back in afterwards instead of being carried
+    # through every intermediate tuple
+    for values in itertools.product(*value_lists):
+        yield dict(zip(keys, values))
 
 class JobBuilder(object):
     """Create a range of jobs to cover the required parameter combinations
@@ -107,14 +129,21 @@ class JobBuilder(object):
 
     def __init__(self, **defaults):
         self._param_lists = {}
+        self._sorted_keys = None
 
         for param, value in defaults.items():
             self.add(param, value)
 
     def _add_list(self, param, values):
+        if isinstance(param, str):
+            # all jobs share the param name as a dict key,
+            # so interning it deduplicates the string
+            # and speeds up later dict lookups
+            param = sys.intern(param)
         if param in self._param_lists:
-            raise RuntimeError("redefinition of parameter {!r}".format(param))
+            raise RuntimeError(f"redefinition of parameter {param!r}")
         self._param_lists[param] = list(values)
+        self._sorted_keys = None
 
 
     def add(self, param, *values):
@@ -200,18 +229,33 @@ class JobBuilder(object):
         if stride <= 0:
             raise ValueError("stride must be positive")
 
-        def _values():
-            # pylint: disable=invalid-name
-            n = 0
-            while True:
-                value = start + n * stride
-                if value <= end:
-                    yield value
-                else:
-                    break
-                n += 1
-
-        values = list(_values())
+        if (_numpy is not None
+                and (end - start) / stride > _NUMPY_MIN_SIZE
+                and not (isinstance(start, int) and isinstance(stride, int))):
+            # float inputs only (all-int input would be promoted to
+            # float64 where the pure loop keeps ints). Multiply-then-add
+            # evaluates start + n*stride exactly like the pure loop;
+            # arange(start, stop, stride) would accumulate a slightly
+            # different step and can even drop the endpoint. The count
+            # overshoots by a couple of values to absorb rounding in
+            # the division, then the exact stop condition trims them.
+            count = int((end - start) / stride) + 3
+            values = (start + _numpy.arange(count) * stride).tolist()
+            while values and values[-1] > end:
+                values.pop()
+        else:
+            def _values():
+                # pylint: disable=invalid-name
+                n = 0
+                while True:
+                    value = start + n * stride
+                    if value <= end:
+                        yield value
+                    else:
+                        break
+                    n += 1
+
+            values = list(_values())
 
         self._add_list(param, values)
         return values
@@ -269,7 +313,14 @@ class JobBuilder(object):
             raise ValueError("num must be at least 2 to include the start and stop")
 
         span = stop - start
-        values = [start + span * (n / (num - 1)) for n in range(num)]
+
+        if _numpy is not None and num > _NUMPY_MIN_SIZE:
+            # the same IEEE operations as the pure formula below, so
+            # both paths are bit-identical; numpy.linspace rounds
+            # differently and would make results depend on the install
+            values = (_numpy.arange(num) / (num - 1) * span + start).tolist()
+        else:
+            values = [start + span * (n / (num - 1)) for n in range(num)]
 
         self._add_list(param, values)
         return values
@@ -363,11 +414,32 @@ class JobBuilder(object):
         if repetitions < 1:
             raise ValueError("at least one repetition required")
 
-        params_product = _dict_list_product(self._param_lists)
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._param_lists)
+
+        keys = self._sorted_keys
+        value_lists = [self._param_lists[key] for key in keys]
+        sizes = [len(values) for values in value_lists]
+
+        total = 1
+        for size in sizes:
+            total *= size
 
         jobs = []
 
-        for job_id, params in enumerate(params_product):
+        for job_id in range(total):
+            # decode the job id as a mixed-radix number,
+            # with the last key as the fastest-changing digit
+            index = job_id
+            value_ixs = [0] * len(sizes)
+            for i in range(len(sizes) - 1, -1, -1):
+                index, value_ixs[i] = divmod(index, sizes[i])
+
+            params = {
+                key: values[value_ix]
+                for key, values, value_ix in zip(keys, value_lists, value_ixs)
+            }
+
             for repetition_id in range(repetitions):
                 jobs.append(Job(job_id, repetition_id, callback, params))
 
@@ -8,6 +8,127 @@ which are focussed on normal usage.
 
 import pytest
 import multijob.commandline as commandline
+import multijob.job
+
+def describe_private_argv_pairs():
+
+    def it_batch_parses_long_argvs():
+        argv = ['p{}=v{}'.format(i, i) for i in range(40)]
+
+        # pylint: disable=protected-access
+        actual = list(commandline._argv_pairs(argv))
+
+        assert actual == [('p{}'.format(i), 'v{}'.format(i))
+                          for i in range(40)]
+
+    def GIVEN_embedded_newline_THEN_parses_exactly():
+        argv = ['a=b\nc=d'] + ['p{}=1'.format(i) for i in range(20)]
+
+        # pylint: disable=protected-access
+        pairs = dict(commandline._argv_pairs(argv))
+
+        assert pairs['a'] == 'b\nc=d'
+
+    def GIVEN_leading_separator_THEN_parses_like_partition():
+        argv = ['=a=b'] + ['p{}=1'.format(i) for i in range(20)]
+
+        # pylint: disable=protected-access
+        pairs = dict(commandline._argv_pairs(argv))
+
+        assert pairs[''] == 'a=b'
+
+    def it_reports_missing_separator_in_long_argvs():
+        argv = ['p{}=1'.format(i) for i in range(20)] + ['oops']
+
+        with pytest.raises(ValueError):
+            # pylint: disable=protected-access
+            list(commandline._argv_pairs(argv))
+
+def describe_private_dict_from_argv():
+
+    def it_rewraps_coercion_errors_with_name_and_value():
+
+        def bad_coercion(value):
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError) as caught:
+            # pylint: disable=protected-access
+            commandline._dict_from_argv(
+                ['a=42'], typemap=dict(a=bad_coercion))
+
+        assert str(caught.value) == "Could not coerce 'a'='42':\nnope"
+
+def describe_coercion_of():
+
+    def it_rejects_mutation_of_named_coercions():
+        # replacing an entry would be silently ignored by the
+        # ahead-of-time resolution, so it must fail loudly instead
+        with pytest.raises(TypeError):
+            commandline.Coercion.NAMED_COERCIONS['int'] = str
+
+    def it_caches_wrappers_for_non_weakrefable_callables():
+        # str.upper is hashable but does not support weak references,
+        # so its wrapper must come from the permanent strong cache
+        first = commandline.Coercion.of(str.upper, paramname='x')
+        second = commandline.Coercion.of(str.upper, paramname='y')
+
+        assert first is second
+        # pylint: disable=protected-access
+        assert str.upper in commandline._STRONG_COERCIONS
+        assert first('x', 'ab') == 'AB'
+
+def describe_argv_from_job():
+
+    def it_preserves_the_sign_of_negative_zero():
+
+        def target():
+            pass
+
+        positive = multijob.job.Job(0, 0, target, dict(x=0.0))
+        negative = multijob.job.Job(1, 0, target, dict(x=-0.0))
+
+        # encode 0.0 first so a cached str() result would be primed
+        assert commandline.argv_from_job(positive)[-1] == 'x=0.0'
+        assert commandline.argv_from_job(negative)[-1] == 'x=-0.0'
+
+    def it_stringifies_non_str_coercion_results():
+
+        def target():
+            pass
+
+        job = multijob.job.Job(1, 0, target, dict(xs=[1, 2]))
+
+        argv = commandline.argv_from_job(job, typemap=dict(xs=len))
+
+        assert argv == ['--id=1', '--rep=0', '--', 'xs=2']
+
+def describe_shell_command_from_job():
+
+    def it_escapes_unsafe_meta_tokens():
+
+        def target():
+            pass
+
+        job = multijob.job.Job('42; rm -rf /', 0, target, dict())
+
+        command = commandline.shell_command_from_job('./run', job)
+
+        assert command == "./run '--id=42; rm -rf /' --rep=0 --"
+
+    def it_escapes_unsafe_config_keys():
+
+        def target():
+            pass
+
+        config = commandline.JobArgvConfig(
+            job_id_key='--my id',
+            repetition_id_key='--rep')
+        job = multijob.job.Job(1, 0, target, dict())
+
+        command = commandline.shell_command_from_job(
+            './run', job, job_argv_config=config)
+
+        assert command == "./run '--my id=1' --rep=0 --"
 
 def describe_job_from_argv():
 
@@ -33,6 +154,49 @@ def describe_job_from_argv():
         with pytest.raises(KeyError):
             commandline.job_from_argv(argv, target, typemap=typemap)
 
+    def it_accepts_none_job_argv_config():
+
+        def target(a):
+            return a
+
+        argv = ['--id=2', '--rep=0', '--', 'a=42']
+        typemap = dict(a='int')
+
+        job = commandline.job_from_argv(
+            argv, target, typemap=typemap, job_argv_config=None)
+
+        assert job.job_id == 2
+
+    def it_matches_the_generic_scan_for_reordered_meta_args():
+
+        def target(a):
+            return a
+
+        typemap = dict(a='int')
+
+        fast = commandline.job_from_argv(
+            ['--id=3', '--rep=1', '--', 'a=2'], target, typemap=typemap)
+        generic = commandline.job_from_argv(
+            ['--rep=1', '--id=3', '--', 'a=2'], target, typemap=typemap)
+
+        assert fast.job_id == generic.job_id == 3
+        assert fast.repetition_id == generic.repetition_id == 1
+        assert fast.params == generic.params == dict(a=2)
+
+    def it_falls_back_to_generic_errors_for_non_int_ids():
+
+        def target(a):
+            return a
+
+        argv = ['--id=nope', '--rep=0', '--', 'a=42']
+        typemap = dict(a='int')
+
+        with pytest.raises(ValueError) as caught:
+            commandline.job_from_argv(argv, target, typemap=typemap)
+
+        assert str(caught.value).startswith(
+            "Could not coerce '--id'='nope':")
+
     def it_throws_on_unexpected_meta_args():
 
         def target():
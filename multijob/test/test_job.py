@@ -1,7 +1,59 @@
 # pylint: disable=missing-docstring,invalid-name,unused-variable
 
+import pytest
 import multijob.job
 
+def describe_add_range():
+
+    def it_keeps_int_values_for_int_input():
+        builder = multijob.job.JobBuilder()
+
+        values = builder.add_range('x', 0, 100, 1)
+
+        assert values == list(range(101))
+        assert all(type(value) is int for value in values)
+
+    def it_matches_the_pure_path_when_numpy_is_used(monkeypatch):
+        # a nonzero start catches step-accumulation differences
+        # that start=0.0 cannot expose
+        pytest.importorskip('numpy')
+
+        builder = multijob.job.JobBuilder()
+        with_numpy = builder.add_range('x', 0.1, 100.0, 1 / 3)
+
+        monkeypatch.setattr(multijob.job, '_numpy', None)
+        builder = multijob.job.JobBuilder()
+        pure = builder.add_range('x', 0.1, 100.0, 1 / 3)
+
+        assert with_numpy == pure
+
+    def it_keeps_the_endpoint_when_numpy_is_used(monkeypatch):
+        pytest.importorskip('numpy')
+
+        builder = multijob.job.JobBuilder()
+        with_numpy = builder.add_range('x', 100.0, 1000.0, 1 / 9)
+
+        monkeypatch.setattr(multijob.job, '_numpy', None)
+        builder = multijob.job.JobBuilder()
+        pure = builder.add_range('x', 100.0, 1000.0, 1 / 9)
+
+        assert len(with_numpy) == len(pure)
+        assert with_numpy == pure
+
+def describe_add_linspace():
+
+    def it_matches_the_pure_path_when_numpy_is_used(monkeypatch):
+        pytest.importorskip('numpy')
+
+        builder = multijob.job.JobBuilder()
+        with_numpy = builder.add_linspace('x', 0.0, 2.0, 100)
+
+        monkeypatch.setattr(multijob.job, '_numpy', None)
+        builder = multijob.job.JobBuilder()
+        pure = builder.add_linspace('x', 0.0, 2.0, 100)
+
+        assert with_numpy == pure
+
 def describe_private_dict_list_product():
 
     def it_returns_dicts_with_each_combination():